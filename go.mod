@@ -1,5 +1,3 @@
 module github.com/wheevu/yt-harvester
 
 go 1.24.0
-
-require golang.org/x/sync v0.17.0
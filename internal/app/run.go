@@ -3,11 +3,13 @@ package app
 import (
 	"context"
 	"fmt"
+	"math/rand"
 	"os"
 	"path/filepath"
+	"strconv"
+	"sync"
 
-	"golang.org/x/sync/errgroup"
-
+	"github.com/wheevu/yt-harvester/internal/cache"
 	"github.com/wheevu/yt-harvester/internal/cli"
 	"github.com/wheevu/yt-harvester/internal/fetch"
 	"github.com/wheevu/yt-harvester/internal/model"
@@ -27,6 +29,14 @@ func Run(ctx context.Context, opts cli.Options, progress func(string)) (string,
 		return "", fmt.Errorf("yt-dlp is required and must be available on PATH")
 	}
 
+	var store *cache.Store
+	if !opts.NoCache {
+		store, err = cache.Open(cache.DefaultTTL, opts.RefreshCache)
+		if err != nil && progress != nil {
+			progress("Cache disabled: " + err.Error())
+		}
+	}
+
 	watchURL := util.BuildWatchURL(videoID)
 	metadata := parse.ExtractMetadata(nil, videoID, watchURL)
 	comments := []model.CommentThread(nil)
@@ -36,28 +46,30 @@ func Run(ctx context.Context, opts cli.Options, progress func(string)) (string,
 		progress("Fetching transcript + metadata/comments...")
 	}
 
-	group, groupCtx := errgroup.WithContext(ctx)
+	// Both fetches report their own failures, so a plain WaitGroup is all the coordination needed.
+	var wg sync.WaitGroup
 	var transcriptErr error
 	var metadataErr error
 
-	group.Go(func() error {
-		transcript, transcriptErr = fetch.FetchTranscript(groupCtx, runner, videoID, watchURL)
-		return nil
-	})
-
-	group.Go(func() error {
-		metadata, comments, metadataErr = fetch.FetchMetadataAndComments(groupCtx, runner, videoID, watchURL)
-		return nil
-	})
+	wg.Add(2)
+	go func() {
+		defer wg.Done()
+		transcript, transcriptErr = fetch.FetchTranscript(ctx, runner, store, videoID, watchURL, opts.DirectCaptions)
+	}()
+	go func() {
+		defer wg.Done()
+		metadata, comments, metadataErr = fetch.FetchMetadataAndComments(ctx, runner, store, videoID, watchURL)
+	}()
+	wg.Wait()
 
-	if err := group.Wait(); err != nil {
-		return "", err
-	}
 	if ctx.Err() != nil {
 		return "", ctx.Err()
 	}
 
 	if progress != nil {
+		if cachedAt, ok := store.OldestHit(); ok {
+			progress("Using cached yt-dlp results from " + cachedAt.Format("2006-01-02 15:04") + "; pass --refresh-cache to re-fetch")
+		}
 		if transcriptErr != nil && len(transcript) == 0 {
 			progress("Transcript unavailable: " + transcriptErr.Error())
 		}
@@ -80,9 +92,67 @@ func Run(ctx context.Context, opts cli.Options, progress func(string)) (string,
 	if err := os.MkdirAll(filepath.Dir(outputPath), 0o755); err != nil {
 		return "", fmt.Errorf("create output directory: %w", err)
 	}
-	if err := os.WriteFile(outputPath, []byte(report), 0o644); err != nil {
+	if err := writeReport(outputPath, report); err != nil {
 		return "", fmt.Errorf("write report: %w", err)
 	}
 
 	return outputPath, nil
 }
+
+// writeReport hands the rendered report to the file in one write without
+// first copying the whole string into a byte slice. The report lands in a
+// sibling temp file first and is renamed into place, so an interrupted run
+// never leaves a truncated report behind. A crash mid-write does leave the
+// hidden .yt-harvester-*.tmp file in the output directory; nothing removes it.
+func writeReport(path, report string) error {
+	// Write through a symlinked output path, as os.WriteFile did, rather than
+	// letting the rename replace the link with a regular file.
+	if resolved, err := filepath.EvalSymlinks(path); err == nil {
+		path = resolved
+	}
+
+	file, err := createReportTemp(filepath.Dir(path))
+	if err != nil {
+		return err
+	}
+	tmpPath := file.Name()
+
+	// Overwritten reports keep their mode; new ones get 0644 less the umask, as
+	// os.WriteFile would have given them. The mode is set before any content is
+	// written so a private report is never briefly readable by others.
+	if info, err := os.Stat(path); err == nil {
+		if err := file.Chmod(info.Mode().Perm()); err != nil {
+			file.Close()
+			os.Remove(tmpPath)
+			return err
+		}
+	}
+	if _, err := file.WriteString(report); err != nil {
+		file.Close()
+		os.Remove(tmpPath)
+		return err
+	}
+	if err := file.Close(); err != nil {
+		os.Remove(tmpPath)
+		return err
+	}
+	if err := os.Rename(tmpPath, path); err != nil {
+		os.Remove(tmpPath)
+		return err
+	}
+	return nil
+}
+
+// createReportTemp opens a fresh file beside the report. Unlike os.CreateTemp,
+// which always uses 0600, it creates with 0644 so the umask still applies.
+func createReportTemp(dir string) (*os.File, error) {
+	for attempt := 0; attempt < 100; attempt++ {
+		name := filepath.Join(dir, ".yt-harvester-"+strconv.FormatUint(rand.Uint64(), 36)+".tmp")
+		file, err := os.OpenFile(name, os.O_RDWR|os.O_CREATE|os.O_EXCL, 0o644)
+		if os.IsExist(err) {
+			continue
+		}
+		return file, err
+	}
+	return nil, fmt.Errorf("create temp file for %s: too many collisions", dir)
+}
@@ -0,0 +1,93 @@
+package app
+
+import (
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+)
+
+func TestWriteReportOverwritesAtomically(t *testing.T) {
+	dir := t.TempDir()
+	path := filepath.Join(dir, "report.txt")
+	if err := os.WriteFile(path, []byte("old report\n"), 0o600); err != nil {
+		t.Fatalf("write existing report: %v", err)
+	}
+
+	if err := writeReport(path, "new report\n"); err != nil {
+		t.Fatalf("write report: %v", err)
+	}
+
+	data, err := os.ReadFile(path)
+	if err != nil {
+		t.Fatalf("read report: %v", err)
+	}
+	if string(data) != "new report\n" {
+		t.Fatalf("got %q", data)
+	}
+
+	info, err := os.Stat(path)
+	if err != nil {
+		t.Fatalf("stat report: %v", err)
+	}
+	if info.Mode().Perm() != 0o600 {
+		t.Fatalf("got mode %v, want existing 0600 kept", info.Mode().Perm())
+	}
+
+	entries, err := os.ReadDir(dir)
+	if err != nil {
+		t.Fatalf("read dir: %v", err)
+	}
+	for _, entry := range entries {
+		if strings.HasSuffix(entry.Name(), ".tmp") {
+			t.Fatalf("temp file left behind: %s", entry.Name())
+		}
+	}
+}
+
+func TestWriteReportNewFileIsNotWorldWritable(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "report.txt")
+	if err := writeReport(path, "report\n"); err != nil {
+		t.Fatalf("write report: %v", err)
+	}
+
+	info, err := os.Stat(path)
+	if err != nil {
+		t.Fatalf("stat report: %v", err)
+	}
+	// The exact mode depends on the umask; it can never exceed the 0644 request.
+	if info.Mode().Perm()&^0o644 != 0 {
+		t.Fatalf("got mode %v", info.Mode().Perm())
+	}
+}
+
+func TestWriteReportWritesThroughSymlink(t *testing.T) {
+	dir := t.TempDir()
+	target := filepath.Join(dir, "target.txt")
+	if err := os.WriteFile(target, []byte("old report\n"), 0o644); err != nil {
+		t.Fatalf("write target: %v", err)
+	}
+	link := filepath.Join(dir, "report.txt")
+	if err := os.Symlink(target, link); err != nil {
+		t.Skipf("symlinks unavailable: %v", err)
+	}
+
+	if err := writeReport(link, "new report\n"); err != nil {
+		t.Fatalf("write report: %v", err)
+	}
+
+	info, err := os.Lstat(link)
+	if err != nil {
+		t.Fatalf("lstat link: %v", err)
+	}
+	if info.Mode()&os.ModeSymlink == 0 {
+		t.Fatalf("expected the output path to remain a symlink")
+	}
+	data, err := os.ReadFile(target)
+	if err != nil {
+		t.Fatalf("read target: %v", err)
+	}
+	if string(data) != "new report\n" {
+		t.Fatalf("got %q", data)
+	}
+}
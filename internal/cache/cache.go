@@ -0,0 +1,177 @@
+package cache
+
+import (
+	"bytes"
+	"compress/gzip"
+	"crypto/sha1"
+	"encoding/hex"
+	"fmt"
+	"io"
+	"os"
+	"path/filepath"
+	"strings"
+	"sync"
+	"time"
+)
+
+// DefaultTTL stays an hour under the roughly six-hour lifetime of the signed
+// track URLs embedded in yt-dlp output, so a cached inspection never hands
+// out URLs that have already expired.
+const DefaultTTL = 5 * time.Hour
+
+// Store keeps gzip-compressed yt-dlp payloads on disk so re-running the same
+// video skips the subprocess entirely. A nil *Store is a valid, disabled cache.
+type Store struct {
+	dir     string
+	ttl     time.Duration
+	refresh bool
+
+	mu        sync.Mutex
+	oldestHit time.Time
+}
+
+// Open prepares the per-user cache directory. With refresh set, lookups always
+// miss but fresh results are still written back.
+func Open(ttl time.Duration, refresh bool) (*Store, error) {
+	root, err := os.UserCacheDir()
+	if err != nil {
+		return nil, fmt.Errorf("locate user cache dir: %w", err)
+	}
+	return OpenDir(filepath.Join(root, "yt-harvester"), ttl, refresh)
+}
+
+// staleTempAge is well past any single Put, so older .entry-* files can only
+// be leftovers from a run that died before its rename.
+const staleTempAge = time.Hour
+
+func OpenDir(dir string, ttl time.Duration, refresh bool) (*Store, error) {
+	if err := os.MkdirAll(dir, 0o755); err != nil {
+		return nil, fmt.Errorf("create cache dir: %w", err)
+	}
+	store := &Store{dir: dir, ttl: ttl, refresh: refresh}
+	store.sweep()
+	return store, nil
+}
+
+// sweep deletes expired entries and abandoned temp files so the cache
+// directory only ever holds what a lookup could still return.
+func (s *Store) sweep() {
+	entries, err := os.ReadDir(s.dir)
+	if err != nil {
+		return
+	}
+
+	now := time.Now()
+	for _, entry := range entries {
+		name := entry.Name()
+		var maxAge time.Duration
+		switch {
+		case strings.HasSuffix(name, ".json.gz"):
+			maxAge = s.ttl
+		case strings.HasPrefix(name, ".entry-"):
+			maxAge = staleTempAge
+		default:
+			continue
+		}
+
+		info, err := entry.Info()
+		if err != nil || now.Sub(info.ModTime()) <= maxAge {
+			continue
+		}
+		os.Remove(filepath.Join(s.dir, name))
+	}
+}
+
+func (s *Store) Get(key string) ([]byte, bool) {
+	if s == nil || s.refresh {
+		return nil, false
+	}
+
+	path := s.path(key)
+	file, err := os.Open(path)
+	if err != nil {
+		return nil, false
+	}
+	defer file.Close()
+
+	info, err := file.Stat()
+	if err != nil {
+		return nil, false
+	}
+	if time.Since(info.ModTime()) > s.ttl {
+		os.Remove(path)
+		return nil, false
+	}
+
+	reader, err := gzip.NewReader(file)
+	if err != nil {
+		return nil, false
+	}
+	defer reader.Close()
+
+	data, err := io.ReadAll(reader)
+	if err != nil {
+		return nil, false
+	}
+	s.noteHit(info.ModTime())
+	return data, true
+}
+
+func (s *Store) noteHit(written time.Time) {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+	if s.oldestHit.IsZero() || written.Before(s.oldestHit) {
+		s.oldestHit = written
+	}
+}
+
+// OldestHit reports when the oldest entry served by Get was written, so callers
+// can tell users how stale a report's counts may be.
+func (s *Store) OldestHit() (time.Time, bool) {
+	if s == nil {
+		return time.Time{}, false
+	}
+	s.mu.Lock()
+	defer s.mu.Unlock()
+	return s.oldestHit, !s.oldestHit.IsZero()
+}
+
+func (s *Store) Put(key string, data []byte) error {
+	if s == nil {
+		return nil
+	}
+
+	var compressed bytes.Buffer
+	writer := gzip.NewWriter(&compressed)
+	if _, err := writer.Write(data); err != nil {
+		return fmt.Errorf("compress cache entry: %w", err)
+	}
+	if err := writer.Close(); err != nil {
+		return fmt.Errorf("compress cache entry: %w", err)
+	}
+
+	// Write beside the target and rename so concurrent runs never read a partial entry.
+	tmp, err := os.CreateTemp(s.dir, ".entry-*")
+	if err != nil {
+		return fmt.Errorf("create cache entry: %w", err)
+	}
+	if _, err := tmp.Write(compressed.Bytes()); err != nil {
+		tmp.Close()
+		os.Remove(tmp.Name())
+		return fmt.Errorf("write cache entry: %w", err)
+	}
+	if err := tmp.Close(); err != nil {
+		os.Remove(tmp.Name())
+		return fmt.Errorf("write cache entry: %w", err)
+	}
+	if err := os.Rename(tmp.Name(), s.path(key)); err != nil {
+		os.Remove(tmp.Name())
+		return fmt.Errorf("store cache entry: %w", err)
+	}
+	return nil
+}
+
+func (s *Store) path(key string) string {
+	sum := sha1.Sum([]byte(key))
+	return filepath.Join(s.dir, hex.EncodeToString(sum[:])+".json.gz")
+}
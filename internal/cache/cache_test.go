@@ -0,0 +1,133 @@
+package cache
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+)
+
+func TestStoreRoundTrip(t *testing.T) {
+	store, err := OpenDir(t.TempDir(), time.Hour, false)
+	if err != nil {
+		t.Fatalf("open store: %v", err)
+	}
+
+	if _, ok := store.Get("comments:abc"); ok {
+		t.Fatalf("expected miss on empty cache")
+	}
+	if err := store.Put("comments:abc", []byte(`{"title":"x"}`)); err != nil {
+		t.Fatalf("put: %v", err)
+	}
+
+	got, ok := store.Get("comments:abc")
+	if !ok {
+		t.Fatalf("expected hit after put")
+	}
+	if string(got) != `{"title":"x"}` {
+		t.Fatalf("got %q", got)
+	}
+}
+
+func TestStoreExpiresAndRefreshes(t *testing.T) {
+	dir := t.TempDir()
+	store, err := OpenDir(dir, time.Hour, false)
+	if err != nil {
+		t.Fatalf("open store: %v", err)
+	}
+	if err := store.Put("inspect:abc", []byte("data")); err != nil {
+		t.Fatalf("put: %v", err)
+	}
+
+	stale := time.Now().Add(-2 * time.Hour)
+	if err := os.Chtimes(store.path("inspect:abc"), stale, stale); err != nil {
+		t.Fatalf("age entry: %v", err)
+	}
+	if _, ok := store.Get("inspect:abc"); ok {
+		t.Fatalf("expected expired entry to miss")
+	}
+
+	if err := store.Put("inspect:abc", []byte("data")); err != nil {
+		t.Fatalf("put: %v", err)
+	}
+	refreshing, err := OpenDir(dir, time.Hour, true)
+	if err != nil {
+		t.Fatalf("open store: %v", err)
+	}
+	if _, ok := refreshing.Get("inspect:abc"); ok {
+		t.Fatalf("expected refresh mode to bypass reads")
+	}
+}
+
+func TestNilStoreIsDisabled(t *testing.T) {
+	var store *Store
+	if err := store.Put("key", []byte("data")); err != nil {
+		t.Fatalf("put on nil store: %v", err)
+	}
+	if _, ok := store.Get("key"); ok {
+		t.Fatalf("expected nil store to miss")
+	}
+}
+
+func TestOpenDirSweepsExpiredEntriesAndTempFiles(t *testing.T) {
+	dir := t.TempDir()
+	store, err := OpenDir(dir, time.Hour, false)
+	if err != nil {
+		t.Fatalf("open store: %v", err)
+	}
+	if err := store.Put("comments:old", []byte("old")); err != nil {
+		t.Fatalf("put: %v", err)
+	}
+	if err := store.Put("comments:new", []byte("new")); err != nil {
+		t.Fatalf("put: %v", err)
+	}
+	leftover := filepath.Join(dir, ".entry-123")
+	if err := os.WriteFile(leftover, []byte("partial"), 0o644); err != nil {
+		t.Fatalf("write leftover: %v", err)
+	}
+
+	stale := time.Now().Add(-2 * time.Hour)
+	for _, path := range []string{store.path("comments:old"), leftover} {
+		if err := os.Chtimes(path, stale, stale); err != nil {
+			t.Fatalf("age %s: %v", path, err)
+		}
+	}
+
+	if _, err := OpenDir(dir, time.Hour, false); err != nil {
+		t.Fatalf("reopen store: %v", err)
+	}
+	for _, path := range []string{store.path("comments:old"), leftover} {
+		if _, err := os.Stat(path); !os.IsNotExist(err) {
+			t.Fatalf("expected %s to be swept, stat err = %v", path, err)
+		}
+	}
+	if _, ok := store.Get("comments:new"); !ok {
+		t.Fatalf("expected fresh entry to survive the sweep")
+	}
+}
+
+func TestOldestHitTracksServedEntries(t *testing.T) {
+	store, err := OpenDir(t.TempDir(), time.Hour, false)
+	if err != nil {
+		t.Fatalf("open store: %v", err)
+	}
+	if _, ok := store.OldestHit(); ok {
+		t.Fatalf("expected no hit before any lookup")
+	}
+
+	if err := store.Put("inspect:abc", []byte("data")); err != nil {
+		t.Fatalf("put: %v", err)
+	}
+	written := time.Now().Add(-30 * time.Minute).Truncate(time.Second)
+	if err := os.Chtimes(store.path("inspect:abc"), written, written); err != nil {
+		t.Fatalf("age entry: %v", err)
+	}
+	if _, ok := store.Get("inspect:abc"); !ok {
+		t.Fatalf("expected hit")
+	}
+
+	got, ok := store.OldestHit()
+	if !ok || !got.Equal(written) {
+		t.Fatalf("got %v, %v; want %v", got, ok, written)
+	}
+}
@@ -7,8 +7,11 @@ import (
 )
 
 type Options struct {
-	Input  string
-	Output string
+	Input          string
+	Output         string
+	NoCache        bool
+	RefreshCache   bool
+	DirectCaptions bool
 }
 
 func Parse(args []string) (Options, error) {
@@ -26,6 +29,12 @@ func Parse(args []string) (Options, error) {
 			}
 			index++
 			opts.Output = strings.TrimSpace(args[index])
+		case arg == "--no-cache":
+			opts.NoCache = true
+		case arg == "--refresh-cache":
+			opts.RefreshCache = true
+		case arg == "--direct-captions":
+			opts.DirectCaptions = true
 		case strings.HasPrefix(arg, "-o="):
 			opts.Output = strings.TrimSpace(strings.TrimPrefix(arg, "-o="))
 		case strings.HasPrefix(arg, "--output="):
@@ -37,6 +46,10 @@ func Parse(args []string) (Options, error) {
 		}
 	}
 
+	if opts.NoCache && opts.RefreshCache {
+		return Options{}, fmt.Errorf("--no-cache and --refresh-cache cannot be used together")
+	}
+
 	if len(positionals) != 1 {
 		return Options{}, fmt.Errorf("expected exactly one YouTube video URL or 11-character video ID")
 	}
@@ -50,7 +63,12 @@ func Parse(args []string) (Options, error) {
 }
 
 func Usage() string {
-	return "Usage: yt-harvester [-o FILE] <youtube-url-or-video-id>\n\n" +
+	return "Usage: yt-harvester [-o FILE] [--no-cache | --refresh-cache] [--direct-captions] <youtube-url-or-video-id>\n\n" +
 		"Build a single .txt report with metadata, timestamped transcript, and comments\n" +
-		"from one YouTube video URL or ID.\n"
+		"from one YouTube video URL or ID.\n\n" +
+		"yt-dlp results are cached for a few hours; --no-cache skips the cache entirely\n" +
+		"and --refresh-cache re-fetches and overwrites cached entries.\n\n" +
+		"--direct-captions downloads the chosen caption track with a plain HTTP request\n" +
+		"instead of a second yt-dlp run. That request ignores any proxy, cookies or\n" +
+		"config set for yt-dlp.\n"
 }
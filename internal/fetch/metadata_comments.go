@@ -5,20 +5,16 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"strings"
 
+	"github.com/wheevu/yt-harvester/internal/cache"
 	"github.com/wheevu/yt-harvester/internal/model"
 	"github.com/wheevu/yt-harvester/internal/parse"
 )
 
-func FetchMetadataAndComments(ctx context.Context, runner *Runner, videoID, watchURL string) (model.Metadata, []model.CommentThread, error) {
+func FetchMetadataAndComments(ctx context.Context, runner *Runner, store *cache.Store, videoID, watchURL string) (model.Metadata, []model.CommentThread, error) {
 	metadata := parse.ExtractMetadata(nil, videoID, watchURL)
 
-	dir, err := os.MkdirTemp("", "yt-harvester-")
-	if err != nil {
-		return metadata, nil, fmt.Errorf("create temp dir: %w", err)
-	}
-	defer os.RemoveAll(dir)
-
 	extractorArgs := fmt.Sprintf(
 		"youtube:max_comments=%d,%d,%d,%d,%d;comment_sort=top;player_client=default",
 		parse.MaxCommentsTotal,
@@ -28,58 +24,88 @@ func FetchMetadataAndComments(ctx context.Context, runner *Runner, videoID, watc
 		parse.MaxCommentDepth,
 	)
 
-	args := []string{
-		"--quiet",
-		"--no-warnings",
-		"--skip-download",
+	// The extractor args carry the comment caps, so changing them never serves stale trims.
+	cacheKey := "comments:" + videoID + ":" + extractorArgs
+	if data, ok := store.Get(cacheKey); ok {
+		if info, err := parse.DecodeInfoJSON(data); err == nil {
+			return parse.ExtractMetadata(info, videoID, watchURL), parse.ExtractCommentThreads(info), nil
+		}
+	}
+
+	dir, err := os.MkdirTemp("", "yt-harvester-")
+	if err != nil {
+		return metadata, nil, fmt.Errorf("create temp dir: %w", err)
+	}
+	defer os.RemoveAll(dir)
+
+	args := quietArgs(
 		"--write-comments",
 		"--write-info-json",
 		"--extractor-args", extractorArgs,
 		"--no-write-playlist-metafiles",
-		"-o", videoID + ".%(ext)s",
+		"-o", videoID+".%(ext)s",
 		watchURL,
-	}
+	)
 
 	// yt-dlp sidecars vary across extractors, so the whole run stays inside one temp directory.
 	if err := runner.Run(ctx, dir, args...); err != nil {
 		return metadata, nil, err
 	}
 
-	info, err := loadInfoJSONFromDir(dir, videoID)
+	data, err := readInfoJSONFromDir(dir, videoID)
 	if err != nil {
 		return metadata, nil, err
 	}
 
+	info, err := parse.DecodeInfoJSON(data)
+	if err != nil {
+		return metadata, nil, fmt.Errorf("decode info json: %w", err)
+	}
+	// A failed cache write only costs the next run a fresh fetch.
+	_ = store.Put(cacheKey, data)
+
 	metadata = parse.ExtractMetadata(info, videoID, watchURL)
 	comments := parse.ExtractCommentThreads(info)
 	return metadata, comments, nil
 }
 
-func loadInfoJSONFromDir(dir, videoID string) (*parse.InfoJSON, error) {
-	primary := filepath.Join(dir, videoID+".info.json")
-	candidates := []string{}
-	if _, err := os.Stat(primary); err == nil {
-		candidates = append(candidates, primary)
-	}
-	if len(candidates) == 0 {
-		matches, err := filepath.Glob(filepath.Join(dir, "*.info.json"))
-		if err != nil {
-			return nil, fmt.Errorf("glob info json: %w", err)
-		}
-		candidates = matches
-	}
-	if len(candidates) == 0 {
-		return nil, fmt.Errorf("yt-dlp did not produce an info.json file")
+func readInfoJSONFromDir(dir, videoID string) ([]byte, error) {
+	path, err := findInfoJSONFile(dir, videoID)
+	if err != nil {
+		return nil, err
 	}
 
-	data, err := os.ReadFile(candidates[0])
+	data, err := os.ReadFile(path)
 	if err != nil {
 		return nil, fmt.Errorf("read info json: %w", err)
 	}
+	return data, nil
+}
 
-	info, err := parse.DecodeInfoJSON(data)
+func findInfoJSONFile(dir, videoID string) (string, error) {
+	// One listing covers both the expected name and the fallback for renamed sidecars.
+	entries, err := os.ReadDir(dir)
 	if err != nil {
-		return nil, fmt.Errorf("decode info json: %w", err)
+		return "", fmt.Errorf("read info json dir: %w", err)
+	}
+
+	primary := videoID + ".info.json"
+	fallback := ""
+	for _, entry := range entries {
+		name := entry.Name()
+		if entry.IsDir() || !strings.HasSuffix(name, ".info.json") {
+			continue
+		}
+		if name == primary {
+			return filepath.Join(dir, name), nil
+		}
+		if fallback == "" {
+			fallback = filepath.Join(dir, name)
+		}
+	}
+
+	if fallback == "" {
+		return "", fmt.Errorf("yt-dlp did not produce an info.json file")
 	}
-	return info, nil
+	return fallback, nil
 }
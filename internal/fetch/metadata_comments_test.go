@@ -0,0 +1,32 @@
+package fetch
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+)
+
+func TestFindInfoJSONFilePrefersVideoID(t *testing.T) {
+	dir := t.TempDir()
+	for _, name := range []string{"a-other.info.json", "abc.en.vtt", "abc.info.json"} {
+		if err := os.WriteFile(filepath.Join(dir, name), nil, 0o644); err != nil {
+			t.Fatalf("write fixture: %v", err)
+		}
+	}
+
+	got, err := findInfoJSONFile(dir, "abc")
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if filepath.Base(got) != "abc.info.json" {
+		t.Fatalf("got %q", got)
+	}
+
+	got, err = findInfoJSONFile(dir, "xyz")
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if filepath.Base(got) != "a-other.info.json" {
+		t.Fatalf("expected fallback sidecar, got %q", got)
+	}
+}
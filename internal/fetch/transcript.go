@@ -2,19 +2,31 @@ package fetch
 
 import (
 	"context"
+	"errors"
 	"fmt"
+	"io"
+	"net"
+	"net/http"
 	"os"
 	"path/filepath"
 	"sort"
 	"strings"
 	"time"
 
+	"github.com/wheevu/yt-harvester/internal/cache"
 	"github.com/wheevu/yt-harvester/internal/model"
 	"github.com/wheevu/yt-harvester/internal/parse"
 )
 
 var preferredTranscriptLanguages = []string{"en", "en-US", "en-GB", "en-CA", "en-AU"}
 
+// captionHTTPClient is shared so direct caption fetches reuse pooled connections.
+var captionHTTPClient = &http.Client{Timeout: 30 * time.Second}
+
+// maxCaptionBytes caps a direct caption download; larger bodies are refused
+// rather than truncated into a partial transcript.
+var maxCaptionBytes int64 = 32 << 20
+
 var transcriptRetryBackoffs = []time.Duration{0, 2 * time.Second, 5 * time.Second, 10 * time.Second}
 
 var sleepWithContext = func(ctx context.Context, delay time.Duration) error {
@@ -35,6 +47,7 @@ type subtitleSelection struct {
 	Language  string
 	Automatic bool
 	Format    string
+	URL       string
 }
 
 func (s subtitleSelection) label() string {
@@ -45,8 +58,11 @@ func (s subtitleSelection) label() string {
 	return fmt.Sprintf("%s/%s/%s", typeLabel, s.Language, s.Format)
 }
 
-func FetchTranscript(ctx context.Context, runner *Runner, videoID, watchURL string) ([]model.TranscriptSegment, error) {
-	info, err := inspectSubtitleTracks(ctx, runner, watchURL)
+// FetchTranscript downloads the best available English track. With
+// directCaptions set, tracks are first fetched straight from the URL yt-dlp
+// reported, which bypasses any proxy, cookies or config the user gave yt-dlp.
+func FetchTranscript(ctx context.Context, runner *Runner, store *cache.Store, videoID, watchURL string, directCaptions bool) ([]model.TranscriptSegment, error) {
+	info, err := inspectSubtitleTracks(ctx, runner, store, videoID, watchURL)
 	if err != nil {
 		return nil, err
 	}
@@ -59,9 +75,7 @@ func FetchTranscript(ctx context.Context, runner *Runner, videoID, watchURL stri
 	attemptOutcomes := make([]transcriptAttemptOutcome, 0, len(selections))
 	for _, selection := range selections {
 		// Track metadata can advertise subtitles that still fail to download or parse cleanly.
-		segments, err := retryTranscriptDownload(ctx, selection, func() ([]model.TranscriptSegment, error) {
-			return downloadCaptionTrack(ctx, runner, videoID, watchURL, selection)
-		})
+		segments, err := downloadSelection(ctx, runner, store, videoID, watchURL, selection, directCaptions)
 		if err != nil {
 			attemptOutcomes = append(attemptOutcomes, transcriptAttemptOutcome{selection: selection, err: err})
 			continue
@@ -98,15 +112,19 @@ func (e *transcriptFetchError) Detail() string {
 	return e.detail
 }
 
-func inspectSubtitleTracks(ctx context.Context, runner *Runner, watchURL string) (*parse.InfoJSON, error) {
-	args := []string{
+func inspectSubtitleTracks(ctx context.Context, runner *Runner, store *cache.Store, videoID, watchURL string) (*parse.InfoJSON, error) {
+	cacheKey := "inspect:" + videoID
+	if data, ok := store.Get(cacheKey); ok {
+		if info, err := parse.DecodeInfoJSON(data); err == nil {
+			return info, nil
+		}
+	}
+
+	args := quietArgs(
 		"-J",
-		"--quiet",
-		"--no-warnings",
-		"--skip-download",
 		"--extractor-args", "youtube:player_client=default",
 		watchURL,
-	}
+	)
 
 	data, err := runner.Output(ctx, "", args...)
 	if err != nil {
@@ -117,6 +135,8 @@ func inspectSubtitleTracks(ctx context.Context, runner *Runner, watchURL string)
 	if err != nil {
 		return nil, fmt.Errorf("decode subtitle inspection json: %w", err)
 	}
+	// A failed cache write only costs the next run a fresh fetch.
+	_ = store.Put(cacheKey, data)
 	return info, nil
 }
 
@@ -126,7 +146,7 @@ func buildTranscriptFallbackChain(info *parse.InfoJSON) []subtitleSelection {
 	}
 
 	chain := make([]subtitleSelection, 0, 8)
-	seen := make(map[subtitleSelection]struct{})
+	seen := make(map[string]struct{})
 
 	appendSelections := func(automatic bool, tracks map[string][]parse.SubtitleTrack, preferredFormats ...string) {
 		for _, candidate := range chooseLanguages(tracks) {
@@ -139,11 +159,12 @@ func buildTranscriptFallbackChain(info *parse.InfoJSON) []subtitleSelection {
 					Language:  candidate.language,
 					Automatic: automatic,
 					Format:    format,
+					URL:       trackURL(candidate.tracks, format),
 				}
-				if _, ok := seen[selection]; ok {
+				if _, ok := seen[selection.label()]; ok {
 					continue
 				}
-				seen[selection] = struct{}{}
+				seen[selection.label()] = struct{}{}
 				chain = append(chain, selection)
 			}
 		}
@@ -193,27 +214,142 @@ func chooseLanguages(tracks map[string][]parse.SubtitleTrack) []subtitleCandidat
 	return append(candidates, fallbacks...)
 }
 
+func trackURL(tracks []parse.SubtitleTrack, format string) string {
+	for _, track := range tracks {
+		if strings.TrimSpace(strings.ToLower(track.Ext)) == format && track.URL != "" {
+			return track.URL
+		}
+	}
+	return ""
+}
+
 func usableTrackList(tracks []parse.SubtitleTrack) bool {
 	return len(tracks) > 0
 }
 
-func downloadCaptionTrack(ctx context.Context, runner *Runner, videoID, watchURL string, selection subtitleSelection) ([]model.TranscriptSegment, error) {
+// downloadSelection retries one track. If the direct fetch is still throttled
+// once the retry budget is spent, the track gets a fresh budget through
+// yt-dlp alone, just as it would without direct fetching.
+func downloadSelection(ctx context.Context, runner *Runner, store *cache.Store, videoID, watchURL string, selection subtitleSelection, direct bool) ([]model.TranscriptSegment, error) {
+	segments, err := retryTranscriptDownload(ctx, selection, func() ([]model.TranscriptSegment, error) {
+		return downloadCaptionTrack(ctx, runner, store, videoID, watchURL, selection, direct)
+	})
+
+	var directErr *directFetchError
+	if err != nil && ctx.Err() == nil && errors.As(err, &directErr) {
+		return retryTranscriptDownload(ctx, selection, func() ([]model.TranscriptSegment, error) {
+			return downloadCaptionTrack(ctx, runner, store, videoID, watchURL, selection, false)
+		})
+	}
+	return segments, err
+}
+
+func downloadCaptionTrack(ctx context.Context, runner *Runner, store *cache.Store, videoID, watchURL string, selection subtitleSelection, direct bool) ([]model.TranscriptSegment, error) {
+	cacheKey := "caption:" + videoID + ":" + selection.label()
+	if data, ok := store.Get(cacheKey); ok {
+		if segments, err := parseTranscriptData(selection.Format, data); err == nil && len(segments) > 0 {
+			return segments, nil
+		}
+	}
+
+	// The inspection pass already resolved the track URL, so fetching it directly skips a
+	// second full yt-dlp extraction. Refused, expired or oversized responses fall back to
+	// yt-dlp at once. Rate limits and server errors go back to the retry loop instead,
+	// since running yt-dlp on top would double traffic against a throttled host.
+	if direct && selection.URL != "" {
+		data, err := fetchCaptionURL(ctx, selection.URL)
+		if err != nil && shouldRetryCaptionFetch(ctx, err) {
+			return nil, &directFetchError{err: err}
+		}
+		if err == nil {
+			if segments, err := parseTranscriptData(selection.Format, data); err == nil && len(segments) > 0 {
+				_ = store.Put(cacheKey, data)
+				return segments, nil
+			}
+		}
+	}
+
+	return downloadCaptionTrackWithYTDLP(ctx, runner, store, cacheKey, videoID, watchURL, selection)
+}
+
+// directFetchError marks a retryable failure of the direct caption fetch, so
+// the caller knows yt-dlp has not been tried yet.
+type directFetchError struct {
+	err error
+}
+
+func (e *directFetchError) Error() string {
+	return "direct caption fetch: " + e.err.Error()
+}
+
+func (e *directFetchError) Unwrap() error {
+	return e.err
+}
+
+// captionStatusError reports a non-200 response from a direct caption fetch.
+type captionStatusError struct {
+	StatusCode int
+}
+
+func (e *captionStatusError) Error() string {
+	return fmt.Sprintf("caption download: HTTP %d", e.StatusCode)
+}
+
+func (e *captionStatusError) retryable() bool {
+	return e.StatusCode == http.StatusTooManyRequests || e.StatusCode >= http.StatusInternalServerError
+}
+
+func shouldRetryCaptionFetch(ctx context.Context, err error) bool {
+	if ctx.Err() != nil {
+		return true
+	}
+	var statusErr *captionStatusError
+	if errors.As(err, &statusErr) {
+		return statusErr.retryable()
+	}
+	var netErr net.Error
+	return errors.As(err, &netErr) && netErr.Timeout()
+}
+
+func fetchCaptionURL(ctx context.Context, trackURL string) ([]byte, error) {
+	request, err := http.NewRequestWithContext(ctx, http.MethodGet, trackURL, nil)
+	if err != nil {
+		return nil, err
+	}
+
+	response, err := captionHTTPClient.Do(request)
+	if err != nil {
+		return nil, err
+	}
+	defer response.Body.Close()
+
+	if response.StatusCode != http.StatusOK {
+		return nil, &captionStatusError{StatusCode: response.StatusCode}
+	}
+	data, err := io.ReadAll(io.LimitReader(response.Body, maxCaptionBytes+1))
+	if err != nil {
+		return nil, err
+	}
+	if int64(len(data)) > maxCaptionBytes {
+		return nil, fmt.Errorf("caption download: body exceeds %d bytes", maxCaptionBytes)
+	}
+	return data, nil
+}
+
+func downloadCaptionTrackWithYTDLP(ctx context.Context, runner *Runner, store *cache.Store, cacheKey, videoID, watchURL string, selection subtitleSelection) ([]model.TranscriptSegment, error) {
 	dir, err := os.MkdirTemp("", "yt-harvester-")
 	if err != nil {
 		return nil, fmt.Errorf("create temp dir: %w", err)
 	}
 	defer os.RemoveAll(dir)
 
-	args := []string{
-		"--quiet",
-		"--no-warnings",
-		"--skip-download",
+	args := quietArgs(
 		"--sub-format", selection.Format,
 		"--sub-langs", selection.Language,
 		"--no-write-playlist-metafiles",
 		"--extractor-args", "youtube:player_client=default",
-		"-o", videoID + ".%(ext)s",
-	}
+		"-o", videoID+".%(ext)s",
+	)
 	if selection.Automatic {
 		args = append(args, "--write-auto-subs")
 	} else {
@@ -230,10 +366,19 @@ func downloadCaptionTrack(ctx context.Context, runner *Runner, videoID, watchURL
 		return nil, err
 	}
 
-	segments, err := parseTranscriptFile(captionPath)
+	data, err := os.ReadFile(captionPath)
+	if err != nil {
+		return nil, fmt.Errorf("read caption file: %w", err)
+	}
+
+	format := strings.TrimPrefix(strings.ToLower(filepath.Ext(captionPath)), ".")
+	segments, err := parseTranscriptData(format, data)
 	if err != nil {
 		return nil, err
 	}
+	if format == selection.Format && len(segments) > 0 {
+		_ = store.Put(cacheKey, data)
+	}
 	return segments, nil
 }
 
@@ -264,6 +409,10 @@ func isRetryableTranscriptError(err error) bool {
 	if err == nil {
 		return false
 	}
+	var statusErr *captionStatusError
+	if errors.As(err, &statusErr) {
+		return statusErr.retryable()
+	}
 	message := strings.ToLower(err.Error())
 	for _, token := range []string{
 		"429",
@@ -383,38 +532,41 @@ func chooseSubtitleFormats(tracks []parse.SubtitleTrack, preferred ...string) []
 	return formats
 }
 
-func parseTranscriptFile(path string) ([]model.TranscriptSegment, error) {
-	ext := strings.ToLower(filepath.Ext(path))
-	if ext == ".json3" {
-		return parse.ParseJSON3CaptionFile(path)
+func parseTranscriptData(format string, data []byte) ([]model.TranscriptSegment, error) {
+	if format == "json3" {
+		return parse.ParseJSON3CaptionData(data)
 	}
-	return parse.ParseCaptionFile(path)
+	return parse.ParseCaptionData(data)
 }
 
+// captionFileExts lists subtitle sidecar extensions in order of preference.
+var captionFileExts = []string{".json3", ".vtt", ".srt"}
+
 func findCaptionFile(dir, videoID string) (string, error) {
-	json3Matches, err := filepath.Glob(filepath.Join(dir, videoID+"*.json3"))
+	// One directory listing serves every format instead of a glob pass per extension.
+	entries, err := os.ReadDir(dir)
 	if err != nil {
-		return "", fmt.Errorf("glob json3 files: %w", err)
-	}
-	if len(json3Matches) > 0 {
-		return json3Matches[0], nil
+		return "", fmt.Errorf("read caption dir: %w", err)
 	}
 
-	vttMatches, err := filepath.Glob(filepath.Join(dir, videoID+"*.vtt"))
-	if err != nil {
-		return "", fmt.Errorf("glob vtt files: %w", err)
-	}
-	if len(vttMatches) > 0 {
-		return vttMatches[0], nil
+	bestPath := ""
+	bestRank := len(captionFileExts)
+	for _, entry := range entries {
+		name := entry.Name()
+		if entry.IsDir() || !strings.HasPrefix(name, videoID) {
+			continue
+		}
+		for rank, ext := range captionFileExts {
+			if rank < bestRank && strings.HasSuffix(name, ext) {
+				bestPath = filepath.Join(dir, name)
+				bestRank = rank
+				break
+			}
+		}
 	}
 
-	srtMatches, err := filepath.Glob(filepath.Join(dir, videoID+"*.srt"))
-	if err != nil {
-		return "", fmt.Errorf("glob srt files: %w", err)
+	if bestPath == "" {
+		return "", fmt.Errorf("yt-dlp did not produce a subtitle file")
 	}
-	if len(srtMatches) > 0 {
-		return srtMatches[0], nil
-	}
-
-	return "", fmt.Errorf("yt-dlp did not produce a subtitle file")
+	return bestPath, nil
 }
@@ -3,6 +3,8 @@ package fetch
 import (
 	"context"
 	"errors"
+	"net/http"
+	"net/http/httptest"
 	"os"
 	"path/filepath"
 	"strings"
@@ -34,6 +36,9 @@ func TestBuildTranscriptFallbackChainPrefersManualThenAuto(t *testing.T) {
 	if chain[0].Language != "en" || chain[0].Format != "vtt" {
 		t.Fatalf("got first selection %+v", chain[0])
 	}
+	if chain[0].URL != "https://example.com/manual-en.vtt" {
+		t.Fatalf("expected track url on first selection, got %q", chain[0].URL)
+	}
 	if chain[1].Automatic || chain[1].Format != "srt" {
 		t.Fatalf("got second selection %+v", chain[1])
 	}
@@ -155,3 +160,145 @@ func TestSummariseTranscriptFailureRateLimitSummary(t *testing.T) {
 		t.Fatalf("unexpected summary: %v", err)
 	}
 }
+
+func TestFindCaptionFilePrefersJSON3ThenVTT(t *testing.T) {
+	dir := t.TempDir()
+	for _, name := range []string{"abc.en.srt", "abc.en.vtt", "abc.info.json", "other.en.json3"} {
+		if err := os.WriteFile(filepath.Join(dir, name), nil, 0o644); err != nil {
+			t.Fatalf("write fixture: %v", err)
+		}
+	}
+
+	got, err := findCaptionFile(dir, "abc")
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if filepath.Base(got) != "abc.en.vtt" {
+		t.Fatalf("got %q", got)
+	}
+
+	if err := os.WriteFile(filepath.Join(dir, "abc.en.json3"), nil, 0o644); err != nil {
+		t.Fatalf("write fixture: %v", err)
+	}
+	got, err = findCaptionFile(dir, "abc")
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if filepath.Base(got) != "abc.en.json3" {
+		t.Fatalf("got %q", got)
+	}
+}
+
+func TestDownloadCaptionTrackFetchesTrackURLDirectly(t *testing.T) {
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Write([]byte(`{"events":[{"tStartMs":0,"dDurationMs":1500,"segs":[{"utf8":"Hello there."}]}]}`))
+	}))
+	defer server.Close()
+
+	selection := subtitleSelection{Language: "en", Automatic: true, Format: "json3", URL: server.URL}
+	// A nil runner proves the yt-dlp fallback is never reached.
+	segments, err := downloadCaptionTrack(context.Background(), nil, nil, "abc", "https://www.youtube.com/watch?v=abc", selection, true)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if len(segments) != 1 || segments[0].Text != "Hello there." {
+		t.Fatalf("got segments %+v", segments)
+	}
+}
+
+func TestDownloadCaptionTrackReturnsRateLimitWithoutYTDLPFallback(t *testing.T) {
+	requests := 0
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		requests++
+		w.WriteHeader(http.StatusTooManyRequests)
+	}))
+	defer server.Close()
+
+	selection := subtitleSelection{Language: "en", Automatic: true, Format: "json3", URL: server.URL}
+	// A nil runner proves a rate-limited fetch never falls through to yt-dlp.
+	_, err := downloadCaptionTrack(context.Background(), nil, nil, "abc", "https://www.youtube.com/watch?v=abc", selection, true)
+	if !isRetryableTranscriptError(err) {
+		t.Fatalf("expected retryable error, got %v", err)
+	}
+	if requests != 1 {
+		t.Fatalf("got %d requests", requests)
+	}
+}
+
+func TestDownloadCaptionTrackFallsBackToYTDLPWhenURLRefused(t *testing.T) {
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.WriteHeader(http.StatusForbidden)
+	}))
+	defer server.Close()
+
+	runner := &Runner{Path: filepath.Join(t.TempDir(), "missing-yt-dlp")}
+	selection := subtitleSelection{Language: "en", Automatic: true, Format: "json3", URL: server.URL}
+	_, err := downloadCaptionTrack(context.Background(), runner, nil, "abc", "https://www.youtube.com/watch?v=abc", selection, true)
+	if err == nil {
+		t.Fatalf("expected the missing yt-dlp binary to fail")
+	}
+	var statusErr *captionStatusError
+	if errors.As(err, &statusErr) {
+		t.Fatalf("expected yt-dlp fallback error, got %v", err)
+	}
+}
+
+func TestDownloadCaptionTrackSkipsDirectFetchByDefault(t *testing.T) {
+	requests := 0
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		requests++
+	}))
+	defer server.Close()
+
+	runner := &Runner{Path: filepath.Join(t.TempDir(), "missing-yt-dlp")}
+	selection := subtitleSelection{Language: "en", Automatic: true, Format: "json3", URL: server.URL}
+	if _, err := downloadCaptionTrack(context.Background(), runner, nil, "abc", "https://www.youtube.com/watch?v=abc", selection, false); err == nil {
+		t.Fatalf("expected the missing yt-dlp binary to fail")
+	}
+	if requests != 0 {
+		t.Fatalf("got %d direct requests, want none", requests)
+	}
+}
+
+func TestDownloadSelectionFallsBackToYTDLPAfterThrottledRetries(t *testing.T) {
+	originalSleep := sleepWithContext
+	sleepWithContext = func(context.Context, time.Duration) error { return nil }
+	defer func() {
+		sleepWithContext = originalSleep
+	}()
+
+	requests := 0
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		requests++
+		w.WriteHeader(http.StatusTooManyRequests)
+	}))
+	defer server.Close()
+
+	runner := &Runner{Path: filepath.Join(t.TempDir(), "missing-yt-dlp")}
+	selection := subtitleSelection{Language: "en", Automatic: true, Format: "json3", URL: server.URL}
+	_, err := downloadSelection(context.Background(), runner, nil, "abc", "https://www.youtube.com/watch?v=abc", selection, true)
+	var directErr *directFetchError
+	if err == nil || errors.As(err, &directErr) {
+		t.Fatalf("expected yt-dlp fallback error, got %v", err)
+	}
+	if requests != len(transcriptRetryBackoffs) {
+		t.Fatalf("got %d direct requests, want %d", requests, len(transcriptRetryBackoffs))
+	}
+}
+
+func TestFetchCaptionURLRejectsOversizedBody(t *testing.T) {
+	originalLimit := maxCaptionBytes
+	maxCaptionBytes = 8
+	defer func() {
+		maxCaptionBytes = originalLimit
+	}()
+
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Write([]byte("WEBVTT\n\n00:00:01.000 --> 00:00:02.000\nHello\n"))
+	}))
+	defer server.Close()
+
+	if _, err := fetchCaptionURL(context.Background(), server.URL); err == nil {
+		t.Fatalf("expected oversized body to be rejected")
+	}
+}
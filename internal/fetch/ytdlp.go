@@ -14,6 +14,18 @@ import (
 
 var ErrYTDLPNotFound = errors.New("yt-dlp not found on PATH")
 
+// yt-dlp -J dumps several hundred KB of JSON, so captured stdout starts large
+// instead of doubling its way up.
+const outputBufferSize = 1 << 20
+
+// quietArgs prefixes the flags every harvester invocation shares: no media
+// download and no console noise that could leak into captured output.
+func quietArgs(extra ...string) []string {
+	args := make([]string, 0, 3+len(extra))
+	args = append(args, "--quiet", "--no-warnings", "--skip-download")
+	return append(args, extra...)
+}
+
 type Runner struct {
 	Path string
 }
@@ -27,15 +39,15 @@ func NewRunner() (*Runner, error) {
 }
 
 func (r *Runner) Run(ctx context.Context, dir string, args ...string) error {
-	_, err := r.exec(ctx, dir, args...)
+	_, err := r.exec(ctx, dir, 0, args...)
 	return err
 }
 
 func (r *Runner) Output(ctx context.Context, dir string, args ...string) ([]byte, error) {
-	return r.exec(ctx, dir, args...)
+	return r.exec(ctx, dir, outputBufferSize, args...)
 }
 
-func (r *Runner) exec(ctx context.Context, dir string, args ...string) ([]byte, error) {
+func (r *Runner) exec(ctx context.Context, dir string, stdoutSize int, args ...string) ([]byte, error) {
 	// Use CommandContext so canceled fetches terminate the yt-dlp subprocess promptly.
 	cmd := exec.CommandContext(ctx, r.Path, args...)
 	cmd.Dir = dir
@@ -43,6 +55,7 @@ func (r *Runner) exec(ctx context.Context, dir string, args ...string) ([]byte,
 
 	var stdout bytes.Buffer
 	var stderr bytes.Buffer
+	stdout.Grow(stdoutSize)
 	cmd.Stdout = &stdout
 	cmd.Stderr = &stderr
 
@@ -3,7 +3,6 @@ package parse
 import (
 	"fmt"
 	"html"
-	"os"
 	"regexp"
 	"strconv"
 	"strings"
@@ -12,25 +11,18 @@ import (
 	"github.com/wheevu/yt-harvester/internal/util"
 )
 
-var (
-	htmlTagPattern         = regexp.MustCompile(`</?[^>]+>`)
-	inlineTimestampPattern = regexp.MustCompile(`<\d{2}:\d{2}:\d{2}\.\d{3}>`)
-)
+// htmlTagPattern also covers inline cue timestamps such as <00:00:01.500>.
+var htmlTagPattern = regexp.MustCompile(`</?[^>]+>`)
 
-func ParseCaptionFile(path string) ([]model.TranscriptSegment, error) {
-	data, err := os.ReadFile(path)
-	if err != nil {
-		return nil, fmt.Errorf("read caption file: %w", err)
-	}
-
-	contents := strings.ReplaceAll(string(data), "\r\n", "\n")
-	lines := strings.Split(contents, "\n")
+func ParseCaptionData(data []byte) ([]model.TranscriptSegment, error) {
+	// Every line is trimmed before use, so CRLF input needs no normalising copy of the whole file.
+	lines := strings.Split(string(data), "\n")
 	segments := make([]model.TranscriptSegment, 0)
 	previousFullText := ""
 
 	for index := 0; index < len(lines); {
 		line := strings.TrimSpace(lines[index])
-		if line == "" || strings.EqualFold(line, "WEBVTT") || strings.HasPrefix(line, "NOTE") {
+		if line == "" || isVTTPreambleLine(line) {
 			index++
 			continue
 		}
@@ -53,7 +45,7 @@ func ParseCaptionFile(path string) ([]model.TranscriptSegment, error) {
 			if current == "" {
 				break
 			}
-			if strings.HasPrefix(current, "Kind:") || strings.HasPrefix(current, "Language:") || strings.HasPrefix(current, "Style:") || strings.HasPrefix(current, "Region:") {
+			if isVTTHeaderField(current) {
 				index++
 				continue
 			}
@@ -90,13 +82,13 @@ func ParseCaptionFile(path string) ([]model.TranscriptSegment, error) {
 }
 
 func parseTimeBounds(line string) (float64, float64, bool) {
-	if !strings.Contains(line, "-->") {
+	startPart, endPart, found := strings.Cut(line, "-->")
+	if !found {
 		return 0, 0, false
 	}
 
-	parts := strings.SplitN(line, "-->", 2)
-	startRaw := strings.ReplaceAll(strings.TrimSpace(parts[0]), ",", ".")
-	endFields := strings.Fields(strings.ReplaceAll(strings.TrimSpace(parts[1]), ",", "."))
+	startRaw := strings.ReplaceAll(strings.TrimSpace(startPart), ",", ".")
+	endFields := strings.Fields(strings.ReplaceAll(endPart, ",", "."))
 	if len(endFields) == 0 {
 		return 0, 0, false
 	}
@@ -155,6 +147,34 @@ func parseTimestampSeconds(raw string) (float64, error) {
 	}
 }
 
+// isVTTPreambleLine reports the WEBVTT header and NOTE blocks. The first byte
+// rules out nearly every line before any string comparison runs.
+func isVTTPreambleLine(line string) bool {
+	switch line[0] {
+	case 'W', 'w':
+		return strings.EqualFold(line, "WEBVTT")
+	case 'N':
+		return strings.HasPrefix(line, "NOTE")
+	}
+	return false
+}
+
+// isVTTHeaderField reports the Kind:/Language:/Style:/Region: fields yt-dlp
+// sometimes leaves inside cue text.
+func isVTTHeaderField(line string) bool {
+	switch line[0] {
+	case 'K':
+		return strings.HasPrefix(line, "Kind:")
+	case 'L':
+		return strings.HasPrefix(line, "Language:")
+	case 'S':
+		return strings.HasPrefix(line, "Style:")
+	case 'R':
+		return strings.HasPrefix(line, "Region:")
+	}
+	return false
+}
+
 func isNumericLine(value string) bool {
 	for _, r := range value {
 		if r < '0' || r > '9' {
@@ -165,8 +185,11 @@ func isNumericLine(value string) bool {
 }
 
 func normalizeCaptionText(value string) string {
-	cleaned := htmlTagPattern.ReplaceAllString(value, "")
-	cleaned = inlineTimestampPattern.ReplaceAllString(cleaned, "")
+	cleaned := value
+	// Tags and inline timestamps open with '<'; most caption lines have neither.
+	if strings.IndexByte(cleaned, '<') >= 0 {
+		cleaned = htmlTagPattern.ReplaceAllString(cleaned, "")
+	}
 	cleaned = html.UnescapeString(cleaned)
 	return util.CompactWhitespace(cleaned)
 }
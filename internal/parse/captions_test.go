@@ -1,14 +1,19 @@
 package parse
 
 import (
+	"os"
 	"path/filepath"
 	"testing"
 )
 
-func TestParseCaptionFile(t *testing.T) {
-	segments, err := ParseCaptionFile(filepath.Join("testdata", "sample.vtt"))
+func TestParseCaptionData(t *testing.T) {
+	data, err := os.ReadFile(filepath.Join("testdata", "sample.vtt"))
 	if err != nil {
-		t.Fatalf("parse caption file: %v", err)
+		t.Fatalf("read fixture: %v", err)
+	}
+	segments, err := ParseCaptionData(data)
+	if err != nil {
+		t.Fatalf("parse caption data: %v", err)
 	}
 	if len(segments) != 5 {
 		t.Fatalf("got %d segments", len(segments))
@@ -29,3 +34,48 @@ func TestParseCaptionFile(t *testing.T) {
 		t.Fatalf("got last text %q", segments[4].Text)
 	}
 }
+
+func TestParseCaptionDataHandlesCRLF(t *testing.T) {
+	contents := "1\r\n00:00:01,000 --> 00:00:02,500\r\nHello there\r\n\r\n2\r\n00:00:03,000 --> 00:00:04,000\r\nGeneral Kenobi\r\n"
+	segments, err := ParseCaptionData([]byte(contents))
+	if err != nil {
+		t.Fatalf("parse caption data: %v", err)
+	}
+	if len(segments) != 2 {
+		t.Fatalf("got %d segments", len(segments))
+	}
+	if segments[0].Text != "Hello there" || segments[0].Start != 1 || segments[0].Duration != 1.5 {
+		t.Fatalf("got first segment %+v", segments[0])
+	}
+	if segments[1].Text != "General Kenobi" {
+		t.Fatalf("got second text %q", segments[1].Text)
+	}
+}
+
+func TestNormalizeCaptionText(t *testing.T) {
+	tests := []struct {
+		input string
+		want  string
+	}{
+		{input: "plain   text ", want: "plain text"},
+		{input: "<c>tagged</c> <00:00:01.500>word", want: "tagged word"},
+		{input: "fish &amp; chips", want: "fish & chips"},
+	}
+
+	for _, tt := range tests {
+		if got := normalizeCaptionText(tt.input); got != tt.want {
+			t.Fatalf("normalizeCaptionText(%q) = %q, want %q", tt.input, got, tt.want)
+		}
+	}
+}
+
+func TestParseCaptionDataSkipsHeaderLines(t *testing.T) {
+	data := "WEBVTT\nKind: captions\nLanguage: en\n\nNOTE generated\n\n00:00:01.000 --> 00:00:02.000\nStyle: ignored\nHello\n"
+	segments, err := ParseCaptionData([]byte(data))
+	if err != nil {
+		t.Fatalf("parse caption data: %v", err)
+	}
+	if len(segments) != 1 || segments[0].Text != "Hello" {
+		t.Fatalf("got segments %+v", segments)
+	}
+}
@@ -1,6 +1,7 @@
 package parse
 
 import (
+	"container/heap"
 	"encoding/json"
 	"fmt"
 	"sort"
@@ -100,13 +101,14 @@ func ExtractCommentThreads(info *InfoJSON) []model.CommentThread {
 	children := make(map[string][]model.Comment)
 	roots := make([]model.Comment, 0, len(info.Comments))
 
-	for _, raw := range info.Comments {
+	for index := range info.Comments {
+		raw := &info.Comments[index]
 		comment, ok := normalizeComment(raw)
 		if !ok {
 			continue
 		}
 
-		parent := strings.TrimSpace(stringValue(raw.Parent))
+		parent := stringValue(raw.Parent)
 		if parent != "" && parent != "root" {
 			children[parent] = append(children[parent], comment)
 			continue
@@ -115,27 +117,17 @@ func ExtractCommentThreads(info *InfoJSON) []model.CommentThread {
 		roots = append(roots, comment)
 	}
 
-	sort.SliceStable(roots, func(i, j int) bool {
-		return roots[i].LikeCount > roots[j].LikeCount
-	})
-
-	if len(roots) > MaxCommentParents {
-		roots = roots[:MaxCommentParents]
-	}
+	roots = topComments(roots, nil, MaxCommentParents)
 
 	threads := make([]model.CommentThread, 0, len(roots))
 	for _, root := range roots {
-		replies := append([]model.Comment(nil), children[root.ID]...)
-		sort.SliceStable(replies, func(i, j int) bool {
-			if replies[i].LikeCount != replies[j].LikeCount {
-				return replies[i].LikeCount > replies[j].LikeCount
-			}
-			return sortableTimestamp(replies[i].Timestamp) > sortableTimestamp(replies[j].Timestamp)
-		})
-
-		if len(replies) > MaxRepliesPerThread {
-			replies = replies[:MaxRepliesPerThread]
+		bucket := children[root.ID]
+		// Timestamps may need string parsing, so each one is resolved once rather than per comparison.
+		timestamps := make([]float64, len(bucket))
+		for index := range bucket {
+			timestamps[index] = sortableTimestamp(bucket[index].Timestamp)
 		}
+		replies := topComments(bucket, timestamps, MaxRepliesPerThread)
 
 		threads = append(threads, model.CommentThread{Root: root, Replies: replies})
 	}
@@ -143,7 +135,105 @@ func ExtractCommentThreads(info *InfoJSON) []model.CommentThread {
 	return threads
 }
 
-func normalizeComment(raw InfoComment) (model.Comment, bool) {
+// topComments returns the first limit comments a stable sort by likes, then
+// by timestamps when given, would produce. timestamps runs parallel to
+// comments. Buckets within the limit are sorted in place; larger ones keep
+// only a bounded heap of the best candidates, so picking 300 roots out of
+// thousands costs O(n log limit) instead of sorting everything.
+func topComments(comments []model.Comment, timestamps []float64, limit int) []model.Comment {
+	if limit <= 0 || len(comments) == 0 {
+		return nil
+	}
+
+	ranked := rankedComments{comments: comments, timestamps: timestamps}
+	if len(comments) <= limit {
+		sort.Stable(ranked)
+		return comments
+	}
+
+	// Ties fall back to input position, which is exactly what a stable sort preserves.
+	before := func(i, j int) bool {
+		if ranked.Less(i, j) {
+			return true
+		}
+		if ranked.Less(j, i) {
+			return false
+		}
+		return i < j
+	}
+
+	kept := &commentIndexHeap{indices: make([]int, 0, limit), before: before}
+	for index := range comments {
+		if kept.Len() < limit {
+			heap.Push(kept, index)
+			continue
+		}
+		if before(index, kept.indices[0]) {
+			kept.indices[0] = index
+			heap.Fix(kept, 0)
+		}
+	}
+
+	sort.Slice(kept.indices, func(i, j int) bool {
+		return before(kept.indices[i], kept.indices[j])
+	})
+	selected := make([]model.Comment, len(kept.indices))
+	for position, index := range kept.indices {
+		selected[position] = comments[index]
+	}
+	return selected
+}
+
+// rankedComments orders comments by likes, then newest first when timestamps
+// are set, swapping the precomputed keys along with the comments.
+type rankedComments struct {
+	comments   []model.Comment
+	timestamps []float64
+}
+
+func (r rankedComments) Len() int { return len(r.comments) }
+
+func (r rankedComments) Less(i, j int) bool {
+	if r.comments[i].LikeCount != r.comments[j].LikeCount {
+		return r.comments[i].LikeCount > r.comments[j].LikeCount
+	}
+	return r.timestamps != nil && r.timestamps[i] > r.timestamps[j]
+}
+
+func (r rankedComments) Swap(i, j int) {
+	r.comments[i], r.comments[j] = r.comments[j], r.comments[i]
+	if r.timestamps != nil {
+		r.timestamps[i], r.timestamps[j] = r.timestamps[j], r.timestamps[i]
+	}
+}
+
+// commentIndexHeap keeps the worst retained comment on top so it can be evicted.
+type commentIndexHeap struct {
+	indices []int
+	before  func(i, j int) bool
+}
+
+func (h *commentIndexHeap) Len() int { return len(h.indices) }
+
+func (h *commentIndexHeap) Less(i, j int) bool {
+	return h.before(h.indices[j], h.indices[i])
+}
+
+func (h *commentIndexHeap) Swap(i, j int) {
+	h.indices[i], h.indices[j] = h.indices[j], h.indices[i]
+}
+
+func (h *commentIndexHeap) Push(value any) {
+	h.indices = append(h.indices, value.(int))
+}
+
+func (h *commentIndexHeap) Pop() any {
+	last := h.indices[len(h.indices)-1]
+	h.indices = h.indices[:len(h.indices)-1]
+	return last
+}
+
+func normalizeComment(raw *InfoComment) (model.Comment, bool) {
 	text := util.CompactWhitespace(raw.Text)
 	if text == "" {
 		return model.Comment{}, false
@@ -216,7 +306,7 @@ func sortableTimestamp(value any) float64 {
 		if unix, err := strconv.ParseFloat(trimmed, 64); err == nil {
 			return unix
 		}
-		if parsed, err := time.Parse(time.RFC3339, strings.ReplaceAll(trimmed, "Z", "+00:00")); err == nil {
+		if parsed, err := time.Parse(time.RFC3339, trimmed); err == nil {
 			return float64(parsed.Unix())
 		}
 		return 0
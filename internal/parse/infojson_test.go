@@ -1,9 +1,14 @@
 package parse
 
 import (
+	"math/rand"
 	"os"
 	"path/filepath"
+	"sort"
+	"strconv"
 	"testing"
+
+	"github.com/wheevu/yt-harvester/internal/model"
 )
 
 func TestDecodeInfoJSONAndExtract(t *testing.T) {
@@ -40,3 +45,71 @@ func TestDecodeInfoJSONAndExtract(t *testing.T) {
 		t.Fatalf("expected highest-liked reply first, got %q", threads[0].Replies[0].ID)
 	}
 }
+
+func TestExtractCommentThreadsGroupsAndOrdersReplies(t *testing.T) {
+	info := &InfoJSON{
+		Comments: []InfoComment{
+			{ID: "r1", Author: "a", Text: "first root", LikeCount: float64(5), Parent: "root"},
+			{ID: "c1", Author: "b", Text: "low reply", LikeCount: float64(1), Parent: "r2", Timestamp: float64(100)},
+			{ID: "r2", Author: "c", Text: "second root", LikeCount: float64(50), Parent: "root"},
+			{ID: "c2", Author: "d", Text: "top reply", LikeCount: float64(9), Parent: "r2", Timestamp: float64(50)},
+			{ID: "c3", Author: "e", Text: "   ", LikeCount: float64(99), Parent: "r2"},
+		},
+	}
+
+	threads := ExtractCommentThreads(info)
+	if len(threads) != 2 {
+		t.Fatalf("got %d threads", len(threads))
+	}
+	if threads[0].Root.ID != "r2" || threads[1].Root.ID != "r1" {
+		t.Fatalf("expected roots ordered by likes, got %q then %q", threads[0].Root.ID, threads[1].Root.ID)
+	}
+	replies := threads[0].Replies
+	if len(replies) != 2 || replies[0].ID != "c2" || replies[1].ID != "c1" {
+		t.Fatalf("unexpected replies: %+v", replies)
+	}
+	if len(threads[1].Replies) != 0 {
+		t.Fatalf("expected no replies for r1, got %+v", threads[1].Replies)
+	}
+}
+
+func TestTopCommentsMatchesStableSort(t *testing.T) {
+	rng := rand.New(rand.NewSource(7))
+	comments := make([]model.Comment, 500)
+	timestamps := make([]float64, len(comments))
+	for index := range comments {
+		comments[index] = model.Comment{ID: strconv.Itoa(index), LikeCount: rng.Intn(20)}
+		timestamps[index] = float64(rng.Intn(5))
+	}
+
+	for _, limit := range []int{40, len(comments)} {
+		for _, byTimestamp := range []bool{false, true} {
+			order := make([]int, len(comments))
+			for index := range order {
+				order[index] = index
+			}
+			sort.SliceStable(order, func(i, j int) bool {
+				left, right := order[i], order[j]
+				if comments[left].LikeCount != comments[right].LikeCount {
+					return comments[left].LikeCount > comments[right].LikeCount
+				}
+				return byTimestamp && timestamps[left] > timestamps[right]
+			})
+
+			input := append([]model.Comment(nil), comments...)
+			var keys []float64
+			if byTimestamp {
+				keys = append([]float64(nil), timestamps...)
+			}
+			got := topComments(input, keys, limit)
+			if len(got) != limit {
+				t.Fatalf("limit %d: got %d comments", limit, len(got))
+			}
+			for position, index := range order[:limit] {
+				if got[position].ID != comments[index].ID {
+					t.Fatalf("limit %d position %d: got %q, want %q", limit, position, got[position].ID, comments[index].ID)
+				}
+			}
+		}
+	}
+}
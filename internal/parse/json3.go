@@ -3,7 +3,6 @@ package parse
 import (
 	"encoding/json"
 	"fmt"
-	"os"
 	"strings"
 	"unicode/utf8"
 
@@ -22,6 +21,9 @@ const (
 	json3HardBlockChars           = 360
 )
 
+// sentenceClosers may trail sentence punctuation without ending the sentence themselves.
+const sentenceClosers = "\"'”’»›)]}"
+
 type json3Document struct {
 	Events []json3Event `json:"events"`
 }
@@ -42,14 +44,6 @@ type json3Cue struct {
 	Text  string
 }
 
-func ParseJSON3CaptionFile(path string) ([]model.TranscriptSegment, error) {
-	data, err := os.ReadFile(path)
-	if err != nil {
-		return nil, fmt.Errorf("read json3 caption file: %w", err)
-	}
-	return ParseJSON3CaptionData(data)
-}
-
 func ParseJSON3CaptionData(data []byte) ([]model.TranscriptSegment, error) {
 	var document json3Document
 	if err := json.Unmarshal(data, &document); err != nil {
@@ -121,38 +115,85 @@ func normalizeJSON3EventText(segs []json3Seg) string {
 	return joined
 }
 
+// json3Block accumulates cue texts as parts so growing a sentence never
+// re-copies or re-tokenises the text gathered so far.
+type json3Block struct {
+	start float64
+	end   float64
+	parts []string
+	chars int
+}
+
+func newJSON3Block(cue json3Cue) json3Block {
+	return json3Block{
+		start: cue.Start,
+		end:   cue.End,
+		parts: []string{cue.Text},
+		chars: utf8.RuneCountInString(cue.Text),
+	}
+}
+
+// add appends a cue; cue texts are already whitespace-compacted, so a single
+// space join matches what CompactWhitespace would produce.
+func (b *json3Block) add(cue json3Cue) {
+	b.end = max(b.end, cue.End)
+	b.parts = append(b.parts, cue.Text)
+	b.chars += 1 + utf8.RuneCountInString(cue.Text)
+}
+
+func (b *json3Block) text() string {
+	return strings.Join(b.parts, " ")
+}
+
+// endsSentence only needs the newest part: earlier parts are followed by it,
+// so they cannot end the block. A part made purely of closing quotes or
+// brackets defers to the full text to see the punctuation before it.
+func (b *json3Block) endsSentence() bool {
+	if len(b.parts) == 0 {
+		return false
+	}
+	last := b.parts[len(b.parts)-1]
+	if strings.TrimRight(last, sentenceClosers+" ") == "" {
+		return endsStrongSentence(b.text())
+	}
+	return endsStrongSentence(last)
+}
+
+func (b *json3Block) cue() json3Cue {
+	return json3Cue{Start: b.start, End: b.end, Text: b.text()}
+}
+
 func buildSentenceBlocks(cues []json3Cue) []json3Cue {
 	blocks := make([]json3Cue, 0, len(cues))
-	current := json3Cue{}
+	var current json3Block
 	haveCurrent := false
 
 	for index, cue := range cues {
 		if !haveCurrent {
-			current = cue
+			current = newJSON3Block(cue)
 			haveCurrent = true
 			continue
 		}
 
-		if shouldBreakBeforeCue(current, cue) {
-			blocks = append(blocks, current)
-			current = cue
+		if shouldBreakBeforeCue(&current, cue) {
+			blocks = append(blocks, current.cue())
+			current = newJSON3Block(cue)
 			continue
 		}
 
-		current.End = maxFloat(current.End, cue.End)
-		current.Text = util.CompactWhitespace(current.Text + " " + cue.Text)
+		current.add(cue)
 
 		var next *json3Cue
 		if index+1 < len(cues) {
 			next = &cues[index+1]
 		}
-		if shouldFlushSentenceBlock(current, next) {
-			blocks = append(blocks, current)
+		if shouldFlushSentenceBlock(&current, next) {
+			blocks = append(blocks, current.cue())
 			haveCurrent = false
 		}
 	}
 	if haveCurrent {
-		blocks = append(blocks, current)
+		blocks = append(blocks, current.cue())
 	}
 
 	for index := 0; index < len(blocks)-1; index++ {
@@ -172,36 +213,36 @@ func buildSentenceBlocks(cues []json3Cue) []json3Cue {
 	return blocks
 }
 
-func shouldBreakBeforeCue(current, next json3Cue) bool {
-	if current.Text == "" {
+func shouldBreakBeforeCue(current *json3Block, next json3Cue) bool {
+	if len(current.parts) == 0 {
 		return false
 	}
 
-	gap := next.Start - current.End
+	gap := next.Start - current.end
 	if gap > json3HardGapSeconds {
 		return true
 	}
 	if startsSpeakerMarker(next.Text) {
-		return endsStrongSentence(current.Text) ||
-			current.End-current.Start >= json3SpeakerSplitDurationSecs ||
-			utf8.RuneCountInString(current.Text) >= json3SpeakerSplitChars
+		return current.endsSentence() ||
+			current.end-current.start >= json3SpeakerSplitDurationSecs ||
+			current.chars >= json3SpeakerSplitChars
 	}
 	return false
 }
 
-func shouldFlushSentenceBlock(current json3Cue, next *json3Cue) bool {
-	if current.Text == "" {
+func shouldFlushSentenceBlock(current *json3Block, next *json3Cue) bool {
+	if len(current.parts) == 0 {
 		return false
 	}
 	if next == nil {
 		return true
 	}
 
-	duration := current.End - current.Start
-	charCount := utf8.RuneCountInString(current.Text)
-	gap := next.Start - current.End
+	duration := current.end - current.start
+	charCount := current.chars
+	gap := next.Start - current.end
 
-	if endsStrongSentence(current.Text) && (gap > json3SentenceGapSeconds || duration >= json3SoftSentenceDurationSecs || charCount >= json3SoftSentenceChars) {
+	if current.endsSentence() && (gap > json3SentenceGapSeconds || duration >= json3SoftSentenceDurationSecs || charCount >= json3SoftSentenceChars) {
 		return true
 	}
 	if duration >= json3HardBlockDurationSecs || charCount >= json3HardBlockChars {
@@ -221,11 +262,11 @@ func endsStrongSentence(value string) bool {
 	}
 	for len(trimmed) > 0 {
 		last, size := utf8.DecodeLastRuneInString(trimmed)
-		switch last {
-		case '"', '\'', '”', '’', ')', ']', '}':
+		switch {
+		case strings.ContainsRune(sentenceClosers, last):
 			trimmed = strings.TrimSpace(trimmed[:len(trimmed)-size])
 			continue
-		case '.', '?', '!':
+		case last == '.' || last == '?' || last == '!' || last == '…':
 			return true
 		default:
 			return false
@@ -233,10 +274,3 @@ func endsStrongSentence(value string) bool {
 	}
 	return false
 }
-
-func maxFloat(left, right float64) float64 {
-	if right > left {
-		return right
-	}
-	return left
-}
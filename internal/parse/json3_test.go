@@ -60,3 +60,36 @@ func TestParseJSON3CaptionDataPrefersSentenceBoundaryBeforeTimeCutoff(t *testing
 		t.Fatalf("expected first segment to stay intact until sentence end, got duration %f", segments[0].Duration)
 	}
 }
+
+func TestJSON3BlockEndsSentenceLooksPastTrailingClosers(t *testing.T) {
+	block := newJSON3Block(json3Cue{Start: 0, End: 1, Text: "He said \"stop."})
+	block.add(json3Cue{Start: 1, End: 2, Text: "\""})
+	if !block.endsSentence() {
+		t.Fatalf("expected sentence end behind a lone closing quote")
+	}
+
+	block.add(json3Cue{Start: 2, End: 3, Text: "and then"})
+	if block.endsSentence() {
+		t.Fatalf("expected open sentence after trailing words")
+	}
+}
+
+func TestEndsStrongSentence(t *testing.T) {
+	tests := []struct {
+		input string
+		want  bool
+	}{
+		{input: "Done.", want: true},
+		{input: "Really?)", want: true},
+		{input: "and so…", want: true},
+		{input: "«Arrêtez!»", want: true},
+		{input: "Mr", want: false},
+		{input: "»", want: false},
+	}
+
+	for _, tt := range tests {
+		if got := endsStrongSentence(tt.input); got != tt.want {
+			t.Fatalf("endsStrongSentence(%q) = %v, want %v", tt.input, got, tt.want)
+		}
+	}
+}
@@ -17,10 +17,27 @@ func Render(input model.ReportInput) string {
 	renderMetadata(&lines, input.Metadata)
 	renderTranscript(&lines, input.Transcript)
 	renderComments(&lines, input.Comments)
-	for len(lines) > 0 && lines[len(lines)-1] == "" {
-		lines = lines[:len(lines)-1]
+	return joinLines(lines)
+}
+
+// joinLines builds the newline-terminated report in one pre-sized buffer.
+func joinLines(lines []string) string {
+	if len(lines) == 0 {
+		return "\n"
+	}
+
+	size := len(lines)
+	for _, line := range lines {
+		size += len(line)
+	}
+
+	var builder strings.Builder
+	builder.Grow(size)
+	for _, line := range lines {
+		builder.WriteString(line)
+		builder.WriteByte('\n')
 	}
-	return strings.Join(lines, "\n") + "\n"
+	return builder.String()
 }
 
 func renderMetadata(lines *[]string, metadata model.Metadata) {
@@ -47,10 +64,17 @@ func renderTranscript(lines *[]string, transcript []model.TranscriptSegment) {
 		return
 	}
 
-	segments := append([]model.TranscriptSegment(nil), transcript...)
-	sort.Slice(segments, func(i, j int) bool {
-		return segments[i].Start < segments[j].Start
-	})
+	// Parsed transcripts normally arrive in order; only copy and sort when they do not.
+	segments := transcript
+	byStart := func(i, j int) bool {
+		return transcript[i].Start < transcript[j].Start
+	}
+	if !sort.SliceIsSorted(transcript, byStart) {
+		segments = append([]model.TranscriptSegment(nil), transcript...)
+		sort.Slice(segments, func(i, j int) bool {
+			return segments[i].Start < segments[j].Start
+		})
+	}
 
 	printed := 0
 	for _, segment := range segments {
@@ -78,14 +102,15 @@ func renderTranscript(lines *[]string, transcript []model.TranscriptSegment) {
 }
 
 func renderComments(lines *[]string, comments []model.CommentThread) {
+	// Comments close the report, so unlike the other sections they add no trailing blank line.
 	appendLine(lines, "COMMENTS")
 	if len(comments) == 0 {
 		appendLine(lines, "(No comments found.)")
-		appendLine(lines, "")
 		return
 	}
 
 	// Render retained comment threads directly; the report stays raw by design.
+	labels := newCommentLabels()
 	printed := 0
 	for _, thread := range comments {
 		rootText := util.CompactWhitespace(thread.Root.Text)
@@ -93,14 +118,7 @@ func renderComments(lines *[]string, comments []model.CommentThread) {
 			continue
 		}
 
-		rootWhen := util.FormatTimestamp(thread.Root.Timestamp)
-		rootTime := ""
-		if rootWhen != "" {
-			rootTime = " [" + rootWhen + "]"
-		}
-
-		appendLine(lines, "- "+normaliseAuthor(thread.Root.Author)+rootTime+" · "+formatLikesLabel(thread.Root.LikeCount))
-		appendWrappedText(lines, rootText, "  ", "  ")
+		appendComment(lines, labels, thread.Root, rootText, rootPrefixes)
 		printed++
 
 		for index, reply := range thread.Replies {
@@ -108,28 +126,78 @@ func renderComments(lines *[]string, comments []model.CommentThread) {
 			if replyText == "" {
 				continue
 			}
-			replyWhen := util.FormatTimestamp(reply.Timestamp)
-			replyTime := ""
-			if replyWhen != "" {
-				replyTime = " [" + replyWhen + "]"
-			}
-
-			branchPrefix := "  ├─ "
-			bodyPrefix := "  │  "
+			prefixes := replyPrefixes
 			if index == len(thread.Replies)-1 {
-				branchPrefix = "  └─ "
-				bodyPrefix = "     "
+				prefixes = lastReplyPrefixes
 			}
-
-			appendLine(lines, branchPrefix+normaliseAuthor(reply.Author)+replyTime+" · "+formatLikesLabel(reply.LikeCount))
-			appendWrappedText(lines, replyText, bodyPrefix, bodyPrefix)
+			appendComment(lines, labels, reply, replyText, prefixes)
 		}
 	}
 
 	if printed == 0 {
 		appendLine(lines, "(No comments found.)")
 	}
-	appendLine(lines, "")
+}
+
+type commentPrefixes struct {
+	branch string
+	body   string
+}
+
+var (
+	rootPrefixes      = commentPrefixes{branch: "- ", body: "  "}
+	replyPrefixes     = commentPrefixes{branch: "  ├─ ", body: "  │  "}
+	lastReplyPrefixes = commentPrefixes{branch: "  └─ ", body: "     "}
+)
+
+func appendComment(lines *[]string, labels *commentLabels, comment model.Comment, text string, prefixes commentPrefixes) {
+	appendLine(lines, prefixes.branch+normaliseAuthor(comment.Author)+labels.when(comment.Timestamp)+" · "+labels.likes(comment.LikeCount))
+	appendWrappedText(lines, text, prefixes.body, prefixes.body)
+}
+
+// commentLabels memoises header labels; many comments share like counts and
+// yt-dlp's approximate timestamps.
+type commentLabels struct {
+	dates map[float64]string
+	liked map[int]string
+}
+
+func newCommentLabels() *commentLabels {
+	return &commentLabels{
+		dates: make(map[float64]string),
+		liked: make(map[int]string),
+	}
+}
+
+// when returns the bracketed date suffix for a comment header, or "" when the
+// timestamp is unknown.
+func (c *commentLabels) when(timestamp any) string {
+	seconds, ok := timestamp.(float64)
+	if !ok {
+		return bracketDate(util.FormatTimestamp(timestamp))
+	}
+	if label, ok := c.dates[seconds]; ok {
+		return label
+	}
+	label := bracketDate(util.FormatTimestamp(seconds))
+	c.dates[seconds] = label
+	return label
+}
+
+func (c *commentLabels) likes(count int) string {
+	if label, ok := c.liked[count]; ok {
+		return label
+	}
+	label := formatLikesLabel(count)
+	c.liked[count] = label
+	return label
+}
+
+func bracketDate(date string) string {
+	if date == "" {
+		return ""
+	}
+	return " [" + date + "]"
 }
 
 func normaliseAuthor(raw string) string {
@@ -156,24 +224,23 @@ func formatLikesLabel(count int) string {
 }
 
 func appendWrappedText(lines *[]string, text, firstPrefix, nextPrefix string) {
-	wrapped := wrapIndentedText(text, commentWrapWidth, firstPrefix, nextPrefix)
-	for _, line := range wrapped {
-		appendLine(lines, line)
-	}
+	*lines = append(*lines, wrapIndentedText(text, commentWrapWidth, firstPrefix, nextPrefix)...)
 }
 
 func wrapIndentedText(text string, width int, firstPrefix, nextPrefix string) []string {
-	text = util.CompactWhitespace(text)
-	if text == "" {
-		return nil
-	}
+	// Fields already drops surrounding and repeated whitespace, so the text is tokenised once.
 	words := strings.Fields(text)
 	if len(words) == 0 {
 		return nil
 	}
 
+	// Prefixes are fixed per call, so their budgets are measured once rather than per word.
+	firstBudget := lineBudgetFor(width, firstPrefix)
+	nextBudget := lineBudgetFor(width, nextPrefix)
+
 	lines := make([]string, 0, 4)
 	currentPrefix := firstPrefix
+	lineBudget := firstBudget
 	currentWords := make([]string, 0, 8)
 	currentLen := 0
 
@@ -183,16 +250,13 @@ func wrapIndentedText(text string, width int, firstPrefix, nextPrefix string) []
 		}
 		lines = append(lines, currentPrefix+strings.Join(currentWords, " "))
 		currentPrefix = nextPrefix
+		lineBudget = nextBudget
 		currentWords = currentWords[:0]
 		currentLen = 0
 	}
 
 	for _, word := range words {
 		wordLen := utf8.RuneCountInString(word)
-		lineBudget := width - utf8.RuneCountInString(currentPrefix)
-		if lineBudget < 20 {
-			lineBudget = 20
-		}
 
 		candidateLen := wordLen
 		if len(currentWords) > 0 {
@@ -201,10 +265,6 @@ func wrapIndentedText(text string, width int, firstPrefix, nextPrefix string) []
 
 		if len(currentWords) > 0 && candidateLen > lineBudget {
 			flush()
-			lineBudget = width - utf8.RuneCountInString(currentPrefix)
-			if lineBudget < 20 {
-				lineBudget = 20
-			}
 		}
 
 		currentWords = append(currentWords, word)
@@ -219,6 +279,14 @@ func wrapIndentedText(text string, width int, firstPrefix, nextPrefix string) []
 	return lines
 }
 
+func lineBudgetFor(width int, prefix string) int {
+	budget := width - utf8.RuneCountInString(prefix)
+	if budget < 20 {
+		return 20
+	}
+	return budget
+}
+
 func valueOrDefault(value, fallback string) string {
 	if strings.TrimSpace(value) == "" {
 		return fallback
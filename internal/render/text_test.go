@@ -55,3 +55,41 @@ func TestRenderTranscriptRoundsSubsecondBounds(t *testing.T) {
 		t.Fatalf("expected rounded subsecond transcript bounds, got:\n%s", got)
 	}
 }
+
+func TestWrapIndentedTextUsesContinuationBudget(t *testing.T) {
+	text := strings.Repeat("word ", 30)
+	got := wrapIndentedText(text, 40, "- ", "     ")
+	if len(got) < 2 {
+		t.Fatalf("expected wrapped output, got %q", got)
+	}
+	if !strings.HasPrefix(got[0], "- ") || !strings.HasPrefix(got[1], "     ") {
+		t.Fatalf("unexpected prefixes: %q", got)
+	}
+	for _, line := range got {
+		if len(line) > 40 {
+			t.Fatalf("line exceeds width: %q", line)
+		}
+	}
+}
+
+func TestRenderTranscriptSortsWithoutMutatingInput(t *testing.T) {
+	transcript := []model.TranscriptSegment{
+		{Start: 5, Duration: 1, Text: "Later"},
+		{Start: 1, Duration: 1, Text: "Earlier"},
+	}
+
+	got := Render(model.ReportInput{Transcript: transcript})
+	if strings.Index(got, "Earlier") > strings.Index(got, "Later") {
+		t.Fatalf("expected transcript sorted by start, got:\n%s", got)
+	}
+	if transcript[0].Text != "Later" {
+		t.Fatalf("expected input transcript to stay untouched, got %+v", transcript)
+	}
+}
+
+func TestRenderEndsWithoutTrailingBlankLine(t *testing.T) {
+	got := Render(model.ReportInput{})
+	if !strings.HasSuffix(got, "COMMENTS\n(No comments found.)\n") {
+		t.Fatalf("unexpected report ending:\n%q", got)
+	}
+}
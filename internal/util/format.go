@@ -9,24 +9,23 @@ import (
 
 func FormatLikeCount(count int) string {
 	if count >= 1_000_000 {
-		if count%1_000_000 == 0 {
-			return fmt.Sprintf("%dM", count/1_000_000)
-		}
-		formatted := fmt.Sprintf("%.1fM", float64(count)/1_000_000)
-		return strings.TrimRight(strings.TrimRight(formatted, "0"), ".")
+		return scaledCount(count, 1_000_000, "M")
 	}
-
 	if count >= 1_000 {
-		if count%1_000 == 0 {
-			return fmt.Sprintf("%dk", count/1_000)
-		}
-		formatted := fmt.Sprintf("%.1fk", float64(count)/1_000)
-		return strings.TrimRight(strings.TrimRight(formatted, "0"), ".")
+		return scaledCount(count, 1_000, "k")
 	}
-
 	return strconv.Itoa(count)
 }
 
+// scaledCount renders exact multiples as integers and everything else with one
+// decimal, matching %.1f rounding.
+func scaledCount(count, unit int, suffix string) string {
+	if count%unit == 0 {
+		return strconv.Itoa(count/unit) + suffix
+	}
+	return strconv.FormatFloat(float64(count)/float64(unit), 'f', 1, 64) + suffix
+}
+
 func FormatIntWithCommas(value int64) string {
 	negative := value < 0
 	if negative {
@@ -83,7 +82,7 @@ func FormatTimestamp(timestamp any) string {
 		if unixValue, err := strconv.ParseInt(trimmed, 10, 64); err == nil {
 			return time.Unix(unixValue, 0).Format("2006-01-02")
 		}
-		if parsed, err := time.Parse(time.RFC3339, strings.ReplaceAll(trimmed, "Z", "+00:00")); err == nil {
+		if parsed, err := time.Parse(time.RFC3339, trimmed); err == nil {
 			return parsed.Format("2006-01-02")
 		}
 		return trimmed
@@ -132,8 +131,22 @@ func Timecode(seconds float64) string {
 	hours := total / 3600
 	minutes := (total % 3600) / 60
 	secs := total % 60
+
+	// Timecodes are emitted for every transcript line, so they skip fmt's reflection.
+	buf := make([]byte, 0, 8)
 	if hours > 0 {
-		return fmt.Sprintf("%02d:%02d:%02d", hours, minutes, secs)
+		buf = appendTwoDigits(buf, hours)
+		buf = append(buf, ':')
+	}
+	buf = appendTwoDigits(buf, minutes)
+	buf = append(buf, ':')
+	buf = appendTwoDigits(buf, secs)
+	return string(buf)
+}
+
+func appendTwoDigits(buf []byte, value int) []byte {
+	if value < 10 {
+		buf = append(buf, '0')
 	}
-	return fmt.Sprintf("%02d:%02d", minutes, secs)
+	return strconv.AppendInt(buf, int64(value), 10)
 }
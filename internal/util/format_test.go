@@ -0,0 +1,55 @@
+package util
+
+import "testing"
+
+func TestTimecode(t *testing.T) {
+	tests := []struct {
+		name  string
+		input float64
+		want  string
+	}{
+		{name: "zero", input: 0, want: "00:00"},
+		{name: "negative", input: -5, want: "00:00"},
+		{name: "minutes", input: 65.9, want: "01:05"},
+		{name: "hours", input: 3723, want: "01:02:03"},
+		{name: "long", input: 360000, want: "100:00:00"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := Timecode(tt.input); got != tt.want {
+				t.Fatalf("got %q, want %q", got, tt.want)
+			}
+		})
+	}
+}
+
+func TestFormatLikeCount(t *testing.T) {
+	tests := []struct {
+		input int
+		want  string
+	}{
+		{input: 0, want: "0"},
+		{input: 999, want: "999"},
+		{input: 1_000, want: "1k"},
+		{input: 10_010, want: "10.0k"},
+		{input: 12_345, want: "12.3k"},
+		{input: 2_000_000, want: "2M"},
+		{input: 2_450_000, want: "2.5M"},
+	}
+
+	for _, tt := range tests {
+		if got := FormatLikeCount(tt.input); got != tt.want {
+			t.Fatalf("FormatLikeCount(%d) = %q, want %q", tt.input, got, tt.want)
+		}
+	}
+}
+
+func TestFormatTimestampParsesRFC3339(t *testing.T) {
+	if got := FormatTimestamp("2024-03-05T12:00:00Z"); got != "2024-03-05" {
+		t.Fatalf("got %q", got)
+	}
+	if got := FormatTimestamp("2024-03-05T12:00:00+00:00"); got != "2024-03-05" {
+		t.Fatalf("got %q", got)
+	}
+}
@@ -5,11 +5,19 @@ import (
 	"path/filepath"
 	"regexp"
 	"strings"
+	"unicode"
+	"unicode/utf8"
 )
 
 var invalidPathCharsPattern = regexp.MustCompile(`[\\/:*?"<>|\x00-\x1f]+`)
 
+// CompactWhitespace trims value and collapses internal whitespace runs to a
+// single space. Most captions and comments are already compact, so those are
+// returned as-is without splitting and re-joining.
 func CompactWhitespace(value string) string {
+	if isCompact(value) {
+		return value
+	}
 	parts := strings.Fields(value)
 	if len(parts) == 0 {
 		return ""
@@ -17,22 +25,38 @@ func CompactWhitespace(value string) string {
 	return strings.Join(parts, " ")
 }
 
+func isCompact(value string) bool {
+	// Starting as if after a space rejects leading whitespace.
+	previousSpace := true
+	for _, r := range value {
+		if r == ' ' {
+			if previousSpace {
+				return false
+			}
+			previousSpace = true
+			continue
+		}
+		if unicode.IsSpace(r) {
+			return false
+		}
+		previousSpace = false
+	}
+	return !previousSpace
+}
+
 func SafePathName(value string) string {
 	const maxLen = 120
 
-	text := CompactWhitespace(value)
-	text = html.UnescapeString(text)
-	text = invalidPathCharsPattern.ReplaceAllString(text, " ")
-	text = CompactWhitespace(text)
-	text = strings.Trim(strings.TrimSpace(text), ". ")
-
-	if text == "" {
-		return "untitled"
+	// Entities never contain whitespace, so unescaping before the single compact
+	// pass gives the same result as compacting on both sides of it.
+	text := html.UnescapeString(value)
+	if hasInvalidPathChar(text) {
+		text = invalidPathCharsPattern.ReplaceAllString(text, " ")
 	}
+	text = strings.Trim(CompactWhitespace(text), ". ")
 
-	runes := []rune(text)
-	if len(runes) > maxLen {
-		text = strings.Trim(strings.TrimSpace(string(runes[:maxLen])), ". ")
+	if utf8.RuneCountInString(text) > maxLen {
+		text = strings.Trim(truncateRunes(text, maxLen), ". ")
 	}
 
 	if text == "" {
@@ -42,6 +66,28 @@ func SafePathName(value string) string {
 	return text
 }
 
+// hasInvalidPathChar mirrors invalidPathCharsPattern so most titles, which are
+// already filesystem-safe, skip the regexp copy.
+func hasInvalidPathChar(value string) bool {
+	for index := 0; index < len(value); index++ {
+		if value[index] < 0x20 || strings.IndexByte(`\/:*?"<>|`, value[index]) >= 0 {
+			return true
+		}
+	}
+	return false
+}
+
+func truncateRunes(value string, limit int) string {
+	count := 0
+	for index := range value {
+		if count == limit {
+			return value[:index]
+		}
+		count++
+	}
+	return value
+}
+
 func ResolveOutputPath(requested, title, videoID string) string {
 	requested = strings.TrimSpace(requested)
 	if requested != "" {
@@ -1,6 +1,9 @@
 package util
 
-import "testing"
+import (
+	"strings"
+	"testing"
+)
 
 func TestSafePathName(t *testing.T) {
 	tests := []struct {
@@ -11,6 +14,9 @@ func TestSafePathName(t *testing.T) {
 		{name: "normal", input: "Hello World", want: "Hello World"},
 		{name: "invalid chars", input: "Hello:/\\*?\"<>|World", want: "Hello World"},
 		{name: "empty", input: "   ", want: "untitled"},
+		{name: "entities", input: "Fish &amp; Chips &lt;live&gt;", want: "Fish & Chips live"},
+		{name: "control and dots", input: "..Line\tone\nTwo..", want: "Line one Two"},
+		{name: "truncated", input: strings.Repeat("é", 119) + " .xyz", want: strings.Repeat("é", 119)},
 	}
 
 	for _, tt := range tests {
@@ -34,3 +40,24 @@ func TestResolveOutputPath(t *testing.T) {
 		t.Fatalf("got %q, want %q", got, want)
 	}
 }
+
+func TestCompactWhitespace(t *testing.T) {
+	tests := []struct {
+		input string
+		want  string
+	}{
+		{input: "", want: ""},
+		{input: "already compact", want: "already compact"},
+		{input: "  padded  ", want: "padded"},
+		{input: "double  space", want: "double space"},
+		{input: "tab\there", want: "tab here"},
+		{input: "no break", want: "no break"},
+		{input: "emoji 🎉 ok", want: "emoji 🎉 ok"},
+	}
+
+	for _, tt := range tests {
+		if got := CompactWhitespace(tt.input); got != tt.want {
+			t.Fatalf("CompactWhitespace(%q) = %q, want %q", tt.input, got, tt.want)
+		}
+	}
+}
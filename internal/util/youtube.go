@@ -3,11 +3,10 @@ package util
 import (
 	"fmt"
 	"net/url"
-	"regexp"
 	"strings"
 )
 
-var videoIDPattern = regexp.MustCompile(`^[A-Za-z0-9_-]{11}$`)
+const videoIDLength = 11
 
 func ExtractVideoID(value string) (string, error) {
 	candidate := strings.TrimSpace(value)
@@ -15,7 +14,7 @@ func ExtractVideoID(value string) (string, error) {
 		return "", fmt.Errorf("no video identifier provided")
 	}
 
-	if videoIDPattern.MatchString(candidate) {
+	if isVideoID(candidate) {
 		return candidate, nil
 	}
 
@@ -25,13 +24,13 @@ func ExtractVideoID(value string) (string, error) {
 
 		if host == "youtu.be" || host == "www.youtu.be" {
 			parts := pathSegments(parsed.Path)
-			if len(parts) > 0 && videoIDPattern.MatchString(parts[0]) {
+			if len(parts) > 0 && isVideoID(parts[0]) {
 				return parts[0], nil
 			}
 		}
 
 		if strings.HasSuffix(host, "youtube.com") {
-			if videoID := parsed.Query().Get("v"); videoIDPattern.MatchString(videoID) {
+			if videoID := queryValue(parsed.RawQuery, "v"); isVideoID(videoID) {
 				return videoID, nil
 			}
 
@@ -39,7 +38,7 @@ func ExtractVideoID(value string) (string, error) {
 			if len(parts) >= 2 {
 				switch parts[0] {
 				case "embed", "shorts", "watch":
-					if videoIDPattern.MatchString(parts[1]) {
+					if isVideoID(parts[1]) {
 						return parts[1], nil
 					}
 				}
@@ -50,7 +49,7 @@ func ExtractVideoID(value string) (string, error) {
 	if strings.Contains(candidate, "/") {
 		parts := strings.Split(candidate, "/")
 		tail := parts[len(parts)-1]
-		if videoIDPattern.MatchString(tail) {
+		if isVideoID(tail) {
 			return tail, nil
 		}
 	}
@@ -62,6 +61,52 @@ func BuildWatchURL(videoID string) string {
 	return fmt.Sprintf("https://www.youtube.com/watch?v=%s", videoID)
 }
 
+// isVideoID reports whether value is an 11-character YouTube ID; a byte loop
+// is much cheaper than running a regexp for every candidate segment.
+func isVideoID(value string) bool {
+	if len(value) != videoIDLength {
+		return false
+	}
+	for index := 0; index < len(value); index++ {
+		switch c := value[index]; {
+		case c >= 'A' && c <= 'Z', c >= 'a' && c <= 'z', c >= '0' && c <= '9', c == '_', c == '-':
+		default:
+			return false
+		}
+	}
+	return true
+}
+
+// queryValue returns the first value for key without building the url.Values
+// map that parsed.Query() allocates for every parameter.
+func queryValue(rawQuery, key string) string {
+	// Mirrors url.ParseQuery: malformed pairs are skipped rather than ending the search.
+	for rawQuery != "" {
+		var pair string
+		pair, rawQuery, _ = strings.Cut(rawQuery, "&")
+		if strings.Contains(pair, ";") {
+			continue
+		}
+		name, value, _ := strings.Cut(pair, "=")
+		if strings.ContainsAny(name, "%+") {
+			unescapedName, err := url.QueryUnescape(name)
+			if err != nil {
+				continue
+			}
+			name = unescapedName
+		}
+		if name != key {
+			continue
+		}
+		unescaped, err := url.QueryUnescape(value)
+		if err != nil {
+			continue
+		}
+		return unescaped
+	}
+	return ""
+}
+
 func pathSegments(value string) []string {
 	raw := strings.Split(value, "/")
 	segments := make([]string, 0, len(raw))
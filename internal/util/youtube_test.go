@@ -1,6 +1,9 @@
 package util
 
-import "testing"
+import (
+	"net/url"
+	"testing"
+)
 
 func TestExtractVideoID(t *testing.T) {
 	tests := []struct {
@@ -14,7 +17,10 @@ func TestExtractVideoID(t *testing.T) {
 		{name: "short url", input: "https://youtu.be/dQw4w9WgXcQ", want: "dQw4w9WgXcQ"},
 		{name: "embed url", input: "https://www.youtube.com/embed/dQw4w9WgXcQ", want: "dQw4w9WgXcQ"},
 		{name: "shorts url", input: "https://www.youtube.com/shorts/dQw4w9WgXcQ", want: "dQw4w9WgXcQ"},
+		{name: "watch url with extra params", input: "https://www.youtube.com/watch?list=PL123&v=dQw4w9WgXcQ&t=42", want: "dQw4w9WgXcQ"},
 		{name: "invalid", input: "https://example.com/video", wantErr: true},
+		{name: "id with bad char", input: "dQw4w9WgXc!", wantErr: true},
+		{name: "id too long", input: "dQw4w9WgXcQQ", wantErr: true},
 	}
 
 	for _, tt := range tests {
@@ -35,3 +41,29 @@ func TestExtractVideoID(t *testing.T) {
 		})
 	}
 }
+
+func TestQueryValue(t *testing.T) {
+	tests := []struct {
+		raw  string
+		want string
+	}{
+		{raw: "v=dQw4w9WgXcQ", want: "dQw4w9WgXcQ"},
+		{raw: "list=PL1&v=dQw4w9WgXcQ&v=other", want: "dQw4w9WgXcQ"},
+		{raw: "vv=x&v=%64Qw4w9WgXcQ", want: "dQw4w9WgXcQ"},
+		{raw: "v=%zz&v=dQw4w9WgXcQ", want: "dQw4w9WgXcQ"},
+		{raw: "%76=dQw4w9WgXcQ", want: "dQw4w9WgXcQ"},
+		{raw: "v=bad;x&v=dQw4w9WgXcQ", want: "dQw4w9WgXcQ"},
+		{raw: "list=PL1", want: ""},
+		{raw: "", want: ""},
+	}
+
+	for _, tt := range tests {
+		if got := queryValue(tt.raw, "v"); got != tt.want {
+			t.Fatalf("queryValue(%q) = %q, want %q", tt.raw, got, tt.want)
+		}
+		parsed, _ := url.ParseQuery(tt.raw)
+		if got := parsed.Get("v"); got != tt.want {
+			t.Fatalf("url.ParseQuery(%q).Get(v) = %q, test expects %q", tt.raw, got, tt.want)
+		}
+	}
+}